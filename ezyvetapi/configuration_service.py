@@ -22,9 +22,11 @@ class ConfigurationService:
     EzyVet API
     
     Env's:
-        EZY_VET_API=path_to_the_api 
-        SERVER_RETRY_SLEEP_TIME=how long to sleep during a retry. 
-        EZYVET_API_FAIL_COUNT=How many times to retry when getting a 429 failure. 
+        EZY_VET_API=path_to_the_api
+        SERVER_RETRY_SLEEP_TIME=how long to sleep during a retry.
+        EZYVET_API_FAIL_COUNT=How many times to retry when getting a 429 failure.
+        EZYVET_API_TIMEOUT=Seconds to wait on an API request before giving up.
+        EZYVET_MAX_WORKERS=Number of threads used for concurrent page and batch fetches.
     '''
 
     @property
@@ -39,6 +41,14 @@ class ConfigurationService:
     def api_fail_count(self):
         return int(self._check_if_value_exists('EZYVET_API_FAIL_COUNT', None, False, default_value=5))
 
+    @property
+    def api_timeout(self):
+        return int(self._check_if_value_exists('EZYVET_API_TIMEOUT', None, False, default_value=60))
+
+    @property
+    def max_workers(self):
+        return int(self._check_if_value_exists('EZYVET_MAX_WORKERS', None, False, default_value=8))
+
     '''
     # End Properties
     '''
@@ -1,34 +1,141 @@
-import json
+import logging
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timedelta
+from operator import itemgetter
 from typing import Dict, Any, Union, Callable, List
+from urllib.parse import urlencode
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 from cbcdb import DBManager
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ezyvetapi.configuration_service import ConfigurationService
 
+logger = logging.getLogger(__name__)
+
+_OAUTH_TOKEN_PATH = 'v1/oauth/access_token'
+
+# Every read scope the integration may need. Kept as a tuple so callers can request a subset and
+# trim what the token server has to authorize.
+_EZYVET_SCOPES = (
+    'read-receiveinvoice', 'read-diagnosticrequest', 'read-tagcategory', 'read-systemsetting', 'read-contactdetailtype', 'read-shelteranimalbooking',
+    'read-stocktransaction', 'read-webhookevents', 'read-presentingproblem', 'read-purchaseorder', 'read-country', 'read-productsupplier',
+    'read-animal', 'read-payment', 'read-consult', 'read-presentingproblemlink', 'read-ledgeraccount', 'read-diagnostic',
+    'read-therapeutic', 'read-diagnosticresultitem', 'read-address', 'read-species', 'read-plan', 'read-purchaseorderitem',
+    'read-wellnessplanmembership', 'read-vaccination', 'read-productminimumstock', 'read-transaction', 'read-integrateddiagnostic', 'read-stockadjustmentitem',
+    'read-wellnessplanmembershipstatusperiod', 'read-tag', 'read-invoice', 'read-contact', 'read-sex', 'read-animalcolour',
+    'read-batch', 'read-assessment', 'read-healthstatus', 'read-breed', 'read-invoiceline', 'read-wellnessplanbenefit',
+    'read-receiveinvoiceitem', 'read-separation', 'read-priceadjustment', 'read-user', 'read-resource', 'read-prescriptionitem',
+    'read-prescription', 'read-physicalexam', 'read-billingcredit', 'read-appointmentstatus', 'read-paymentmethod', 'read-tagname',
+    'read-taxrate', 'read-communication', 'read-wellnessplanmembershipoption', 'read-stockadjustment', 'read-appointmenttype', 'read-productgroup',
+    'read-webhooks', 'read-product', 'read-operation', 'read-history', 'read-diagnosticresult', 'read-paymentallocation',
+    'read-attachment', 'read-contactdetail', 'read-productpricing', 'read-contactassociation', 'read-wellnessplanbenefititem', 'read-appointment',
+    'read-jobqueue', 'read-wellnessplan',
+)
+
+_OAUTH_SCOPE = ','.join(_EZYVET_SCOPES)
+
+# Headers sent with every request. JSON compresses well, so asking for compressed responses cuts
+# transfer time on large pages; the session keeps connections alive, but being explicit costs nothing.
+_BASE_HEADERS = {'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'}
+
 
 class EzyVetApi:
     """
     Queries the EzyVet API.
     """
 
-    def __init__(self, test_mode=False):
+    # Fixed slots keep per-instance memory down and speed attribute access when instances are created
+    # per worker. Subclasses without __slots__ (the test mocks) still get a __dict__ for extras.
+    __slots__ = ('_config', '_db', '_default_page_size', 'start_time', '_api_credentials_cache',
+                 '_credential_locks', '_translation_cache', '_max_workers', '_thread_local', '_sessions',
+                 '_executor', '_executor_lock', '_api_timeout', '_decode_json')
+
+    def __init__(self, test_mode=False, page_size=200):
         self._config = ConfigurationService(test_mode)
         # In test mode the self._db value will be set externally by the unit test.
         self._db = DBManager() if not test_mode else None
+        # Records requested per page unless the caller supplies their own limit. Large backfills can raise
+        # this to cut round trips; interactive callers can shrink it.
+        self._default_page_size = page_size
         self.start_time = None
-        self._access_token_cache = None
-        # Start out with a now expire time
-        self._access_token_cache_expire = datetime.now()
+        # In-memory credential cache in the format {location_id: (credentials, expire_epoch)}. Keyed by
+        # location so one instance can serve several locations without re-querying the database per call.
+        self._api_credentials_cache = {}
+        # One lock per location serializes credential refreshes; see _get_cached_credentials.
+        self._credential_locks = defaultdict(threading.Lock)
+        # Reference tables change rarely; translations are cached for a short TTL so repeated loads within
+        # one run reuse a single fetch. Format: {(location_id, ver, name): (translation, fetched_at)}.
+        self._translation_cache = {}
+        # Thread count for the concurrent page and batch fetches.
+        self._max_workers = self._config.max_workers
+        # Sessions are created lazily, one per thread (see the _session property), so worker threads in
+        # the page/batch pools never contend on a shared connection pool. Each session keeps its TCP+TLS
+        # connections alive between pages.
+        self._thread_local = threading.local()
+        self._sessions = []
+        # A single long-lived pool shared by the page and batch fetches. Worker threads persist between
+        # pulls, so their thread-local sessions (and pooled connections) are reused instead of being
+        # rebuilt per call. Created lazily; see _get_executor.
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._api_timeout = self._config.api_timeout
+        # Response-body decoder. A hook so callers can swap in a different decoder (e.g. a typed
+        # msgspec decoder) without subclassing; orjson is the fast default.
+        self._decode_json = orjson.loads
 
     '''
     # Section - Public Methods
     '''
 
+    @property
+    def _session(self) -> requests.Session:
+        """
+        The current thread's HTTP session, created on first use.
+        """
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._build_session(self._max_workers)
+            self._thread_local.session = session
+            # list.append is atomic, so no lock is needed to track sessions for close().
+            self._sessions.append(session)
+        return session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        The instance's shared worker pool, created on first use.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool and closes every HTTP session this instance has opened, releasing
+        their pooled connections.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        while self._sessions:
+            self._sessions.pop().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def get(self,
             location_id: int,
             endpoint_ver: str,
@@ -53,13 +160,7 @@ class EzyVetApi:
         endpoint = f'{endpoint_ver}/{endpoint_name}'
         db = self._db
         params = self._build_params(params)
-        if not self._access_token_cache or self._access_token_cache_expire <= datetime.now():
-            api_credentials = self._get_api_credentials(location_id, self._config.ezy_vet_api, db,
-                                                        self.get_access_token, 10)
-            self._access_token_cache_expire = datetime.now() + timedelta(minutes=10)
-            self._access_token_cache = api_credentials
-        else:
-            api_credentials = self._access_token_cache
+        api_credentials = self._get_cached_credentials(location_id)
         headers = self._set_headers(api_credentials, headers)
         api_url = self._config.ezy_vet_api
         output = self._get_data_from_api(api_url=api_url,
@@ -70,7 +171,10 @@ class EzyVetApi:
                                          location_id=location_id)
         if dataframe_flag:
             if output:
-                return pd.DataFrame(output)
+                # Pivoting to a dict of column lists lets pandas build each column in one shot.
+                columns = list(output[0].keys())
+                data = {col: [record.get(col) for record in output] for col in columns}
+                return pd.DataFrame(data)
             else:
                 return None
         return output
@@ -117,7 +221,9 @@ class EzyVetApi:
                    ids: Union[int, List[int]],
                    id_field: str = 'id',
                    params: dict = None,
-                   dataframe_flag: bool = False) -> Union[list, pd.DataFrame]:
+                   dataframe_flag: bool = False,
+                   calls_per_minute_limit: int = 60,
+                   seconds_in_a_min: int = 60) -> Union[list, pd.DataFrame]:
         """
         Get's records from API by ID or list of ID's.
 
@@ -129,24 +235,48 @@ class EzyVetApi:
             id_field: Name of the field to match on. Defaults to 'id'.
             params: Optional parameters to include in filter.
             dataframe_flag: When set to true, method will return results in a Pandas DataFrame format.
+            calls_per_minute_limit: The number of calls that can be made to the API in one minute.
+            seconds_in_a_min: The number of seconds in a minute. This gets overridden during unit tests so
+                              that the test doesn't take too long.
 
         Returns:
             dataframe_flag = False: A list of dicts containing the data.
             dataframe_flag = True: A DataFrame containing the data.
         """
-        df = pd.DataFrame()
         if isinstance(ids, int):
             ids = [ids]
+        batch_params_list = []
         for x in range(0, len(ids), 100):
-            # This is just used for the print output.
-            end = {x + 100} if len(ids) > 100 else len(ids)
-            print(f'Getting records from {endpoint_ver}/{endpoint_name} IDs: {x}: {end} of {len(ids)}.')
-            if params:
-                params[id_field] = {'in': ids[x: x + 100]}
-            else:
-                params = {id_field: {'in': ids[x: x + 100]}}
-            df_batch = self.get(location_id, endpoint_ver, endpoint_name, params, dataframe_flag=True)
-            df = pd.concat([df, df_batch])
+            end = min(x + 100, len(ids))
+            logger.info('Getting records from %s/%s IDs: %s: %s of %s.', endpoint_ver, endpoint_name, x, end, len(ids))
+            # Build a fresh params dict per batch so the caller's dict is never mutated.
+            batch_params_list.append({**params, id_field: {'in': ids[x: x + 100]}} if params
+                                     else {id_field: {'in': ids[x: x + 100]}})
+        if self._db is not None:
+            # Warm the credential cache once up front so concurrent batches don't each hit the database.
+            self._get_cached_credentials(location_id)
+        if len(batch_params_list) == 1:
+            results = [self.get(location_id, endpoint_ver, endpoint_name, batch_params_list[0], dataframe_flag=True)]
+        else:
+            # Each batch is an independent call fetched concurrently, but batches count against the same
+            # 60-calls-per-minute endpoint limit as pagination, so they are dispatched in allowance-sized
+            # waves. executor.map keeps the results in submission order.
+            executor = self._get_executor()
+            minute_call_counter = 0
+            self.start_time = datetime.now() if not self.start_time else self.start_time
+            results = []
+            while batch_params_list:
+                minute_call_counter = self._throttle(minute_call_counter, calls_per_minute_limit,
+                                                     seconds_in_a_min)
+                wave = batch_params_list[:calls_per_minute_limit - minute_call_counter]
+                del batch_params_list[:len(wave)]
+                results.extend(executor.map(
+                    lambda batch_params: self.get(location_id, endpoint_ver, endpoint_name, batch_params,
+                                                  dataframe_flag=True),
+                    wave))
+                minute_call_counter += len(wave)
+        batches = [df_batch for df_batch in results if df_batch is not None]
+        df = self._concat_batches(batches)
 
         # Now that the batch is complete, reset the get_appointments time
         self.start_time = None
@@ -156,14 +286,15 @@ class EzyVetApi:
         else:
             return df.to_dict('records')
 
-    @staticmethod
-    def get_access_token(api_url: str, api_credentials: Dict[str, Union[str, int]]) -> str:
+    def get_access_token(self, api_url: str, api_credentials: Dict[str, Union[str, int]],
+                         scopes: List[str] = None) -> str:
         """
         Requests an access token from the EzyVet API
 
         Args:
             api_url: URL to the API
             api_credentials: A dict containing all API credentials
+            scopes: Optional list of scopes to request. Defaults to every read scope in _EZYVET_SCOPES.
 
         Returns:
             A string containing an access token. Any prior access tokens will be invalidated when a new access token
@@ -174,35 +305,48 @@ class EzyVetApi:
         Step 1: Get bearer token for authentication
         '''
         # Setup the parameters
-        url = f"{api_url}v1/oauth/access_token"
+        url = f"{api_url}{_OAUTH_TOKEN_PATH}"
         # This will be the body of the request
         payload = {
             'partner_id': api_credentials['partner_id'],
             'client_id': api_credentials['client_id'],
             'client_secret': api_credentials['client_secret'],
             'grant_type': 'client_credentials',
-            'scope': 'read-receiveinvoice,read-diagnosticrequest,read-tagcategory,read-systemsetting,read-contactdetailtype,read-shelteranimalbooking,read-stocktransaction,read-webhookevents,read-presentingproblem,read-purchaseorder,read-country,read-productsupplier,read-animal,read-payment,read-consult,read-presentingproblemlink,read-ledgeraccount,read-diagnostic,read-therapeutic,read-diagnosticresultitem,read-address,read-species,read-plan,read-purchaseorderitem,read-wellnessplanmembership,read-vaccination,read-productminimumstock,read-transaction,read-integrateddiagnostic,read-stockadjustmentitem,read-wellnessplanmembershipstatusperiod,read-tag,read-invoice,read-contact,read-sex,read-animalcolour,read-batch,read-assessment,read-healthstatus,read-breed,read-invoiceline,read-wellnessplanbenefit,read-receiveinvoiceitem,read-separation,read-priceadjustment,read-user,read-resource,read-prescriptionitem,read-prescription,read-physicalexam,read-billingcredit,read-appointmentstatus,read-paymentmethod,read-tagname,read-taxrate,read-communication,read-wellnessplanmembershipoption,read-stockadjustment,read-appointmenttype,read-productgroup,read-webhooks,read-product,read-operation,read-history,read-diagnosticresult,read-paymentallocation,read-attachment,read-contactdetail,read-productpricing,read-contactassociation,read-wellnessplanbenefititem,read-appointment,read-jobqueue,read-wellnessplan'
+            'scope': ','.join(scopes) if scopes else _OAUTH_SCOPE
         }
         # Note this is a post type, not a get. That allows for variables sent in the body.
-        res = requests.post(url, data=payload)
-        data = res.json()
+        res = self._session.post(url, data=payload, timeout=self._api_timeout)
+        data = self._decode_json(res.content)
         access_token = data['access_token']
         return access_token
 
-    def get_translation(self, location_id: int, endpoint_ver: str, endpoint_name: str) -> dict:
+    def get_translation(self, location_id: int, endpoint_ver: str, endpoint_name: str,
+                        refresh: bool = False) -> dict:
         """
         Returns a translation dictionary to convert an id number into a string value
 
+        Results are cached for five minutes per (location, endpoint) so repeated loads in one run don't
+        re-fetch an unchanged reference table.
+
         Args:
             location_id: Location ID to query.
             endpoint_ver: version of the endpoint, v1 or v2
             endpoint_name: Name of the endpoint ex. animals
+            refresh: When set to True, bypasses the cache and re-fetches the table.
 
         Returns:
             Returns a dictionary in the format {1:'translation_name'}
         """
-        df = self.get(location_id, endpoint_ver, endpoint_name, dataframe_flag=True)
-        translation = {int(x['id']): x['name'] for x in df.to_dict(orient='records')}
+        cache_key = (location_id, endpoint_ver, endpoint_name)
+        cached = self._translation_cache.get(cache_key)
+        if cached and not refresh and datetime.now() - cached[1] < timedelta(minutes=5):
+            return cached[0]
+        records = self.get(location_id, endpoint_ver, endpoint_name)
+        if records:
+            translation = dict(zip((int(x['id']) for x in records), (x['name'] for x in records)))
+        else:
+            translation = {}
+        self._translation_cache[cache_key] = (translation, datetime.now())
         return translation
 
     '''
@@ -210,7 +354,132 @@ class EzyVetApi:
     '''
 
     @staticmethod
-    def _build_params(params: Dict[str, Union[str, int]] = None) -> Dict[str, Union[str, int]]:
+    def _concat_batches(batches: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Joins a list of batch DataFrames into one.
+
+        All batches come from the same endpoint, so when their columns share a single common dtype the frames
+        are stacked at the numpy level, which skips the block consolidation pd.concat performs. Mixed-dtype
+        frames fall back to a single pd.concat.
+
+        Args:
+            batches: DataFrames to join. May be empty.
+
+        Returns:
+            One DataFrame containing all batch rows.
+        """
+        if not batches:
+            return pd.DataFrame()
+        if len(batches) == 1:
+            return batches[0]
+        first = batches[0]
+        homogeneous = first.dtypes.nunique() == 1 and all(
+            b.columns.equals(first.columns) and (b.dtypes == first.dtypes).all() for b in batches[1:])
+        if homogeneous:
+            values = np.concatenate([b.to_numpy() for b in batches], axis=0)
+            return pd.DataFrame(values, columns=first.columns)
+        return pd.concat(batches, ignore_index=True)
+
+    def _get_cached_credentials(self, location_id: int) -> Dict[str, Any]:
+        """
+        Returns API credentials for a location, serving from the in-memory cache when still fresh.
+
+        Args:
+            location_id: Location ID to retrieve credentials for.
+
+        Returns:
+            A dictionary containing the credentials.
+        """
+        cached = self._api_credentials_cache.get(location_id)
+        # Expiry is stored as an epoch float so the hot-path freshness check is a plain number compare
+        # rather than datetime arithmetic.
+        if cached and cached[1] > time.time():
+            return cached[0]
+        # Per-location lock so concurrent workers hitting an expired entry perform one refresh between
+        # them instead of racing the DB and token server. The re-check inside the lock picks up a refresh
+        # completed while waiting.
+        with self._credential_locks[location_id]:
+            cached = self._api_credentials_cache.get(location_id)
+            if cached and cached[1] > time.time():
+                return cached[0]
+            api_credentials = self._get_api_credentials(location_id, self._config.ezy_vet_api, self._db,
+                                                        self.get_access_token, 10)
+            # Precompute the Authorization header value once per refresh so _set_headers doesn't rebuild
+            # it on every call.
+            api_credentials['bearer'] = f'Bearer {api_credentials["access_token"]}'
+            # Cache for a minute less than the DB-level limit as a safety margin against token expiry.
+            self._api_credentials_cache[location_id] = (api_credentials, time.time() + 9 * 60)
+        return api_credentials
+
+    def _get_api_credentials_many(self, location_ids: List[int], cache_limit: int = 10) -> Dict[int, Dict[str, Any]]:
+        """
+        Retrieves API credentials for several locations with a single database query.
+
+        Callers that loop over locations can warm the credential cache in one round trip instead of one
+        query per location. Stale tokens are still refreshed individually.
+
+        Args:
+            location_ids: Location IDs to retrieve credentials for.
+            cache_limit: Number of minutes before an access_token is considered expired. See
+                         _get_api_credentials.
+
+        Returns:
+            A dictionary mapping each location ID to its credentials.
+        """
+        db = self._db
+        schema = db.db_schema
+        # A tuple parameter expands to an IN list, which works on both Redshift and Postgres; ANY(ARRAY)
+        # does not exist on Redshift.
+        sql = f'select *, getdate() as system_time from {schema}.ezy_vet_credentials where location_id in %s'
+        res = db.get_sql_list_dicts(sql, [tuple(location_ids)])
+        found = {credentials['location_id']: credentials for credentials in res}
+        missing = [x for x in location_ids if x not in found]
+        if missing:
+            raise MissingEzyVetCredentials(f"No database record was found for location IDs {missing}")
+        api_url = self._config.ezy_vet_api
+        output = {}
+        for location_id, credentials in found.items():
+            system_time = credentials['system_time'].replace(tzinfo=None)
+            expire_date = system_time - timedelta(minutes=cache_limit)
+            if not credentials['access_token'] or expire_date > credentials['access_token_create_time']:
+                credentials['access_token'] = self.get_access_token(api_url, credentials)
+                sql = f'update {schema}.ezy_vet_credentials set access_token=%s, access_token_create_time=%s where location_id = %s'
+                db.execute_simple(sql, [credentials['access_token'], system_time, location_id])
+            credentials['bearer'] = f'Bearer {credentials["access_token"]}'
+            self._api_credentials_cache[location_id] = (credentials, time.time() + 9 * 60)
+            output[location_id] = credentials
+        return output
+
+    @staticmethod
+    def _build_session(max_workers: int = 8) -> requests.Session:
+        """
+        Creates a requests session with a connection pool.
+
+        Reusing a single session keeps the connection to the EzyVet server alive, avoiding a new TCP and TLS
+        handshake for every page of a paginated pull.
+
+        Args:
+            max_workers: Worker-thread count; the pool is sized to at least this so concurrent fetches never
+                         wait on a connection.
+
+        Returns:
+            A requests Session with pooling adapters mounted.
+        """
+        session = requests.Session()
+        # Transient server errors and rate limits are retried in the adapter with exponential backoff,
+        # honoring any Retry-After header the server sends. 401s are handled in _call_api since they need a
+        # token refresh rather than a retry.
+        retries = Retry(total=5,
+                        backoff_factor=1.0,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset(['GET', 'POST']),
+                        respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(20, max_workers), max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _build_params(self, params: Dict[str, Union[str, int]] = None) -> Dict[str, Union[str, int]]:
         """
         Builds a dictionary with query parameters and renders any dict or list values to a JSON string
 
@@ -220,16 +489,15 @@ class EzyVetApi:
         Returns:
             A dictionary containing parameters with keys rendered to JSON string if a dict or a list
         """
-        if params:
-            params['limit'] = 200
-        else:
-            params = {'limit': 200}
-        output = {}
+        # Build into a new dict so the caller's params are never mutated. A caller-supplied limit wins over
+        # the default.
+        if not params:
+            return {'limit': self._default_page_size}
+        output = {'limit': self._default_page_size, **params}
+        # The common case is all-scalar params; only pay for encoding when a nested value is present.
         for key, value in params.items():
-            if isinstance(value, dict) or isinstance(value, list):
-                output[key] = json.dumps(value)
-            else:
-                output[key] = value
+            if isinstance(value, (dict, list)):
+                output[key] = orjson.dumps(value).decode()
         return output
 
     @staticmethod
@@ -282,10 +550,12 @@ class EzyVetApi:
         Returns:
             A dict containing the authorization headers, along with any optional user specific headers.
         """
-        if headers:
-            headers['Authorization'] = f'Bearer {api_credentials["access_token"]}'
-        else:
-            headers = {'Authorization': f'Bearer {api_credentials["access_token"]}'}
+        # Cached credentials carry a precomputed bearer string; fall back to building it for credentials
+        # that came straight from the database.
+        bearer = api_credentials.get('bearer') or f'Bearer {api_credentials["access_token"]}'
+        # Caller-supplied headers override the template; Authorization always comes from the credentials.
+        headers = {**_BASE_HEADERS, **headers} if headers else dict(_BASE_HEADERS)
+        headers['Authorization'] = bearer
         return headers
 
     def _get_data_from_api(self,
@@ -317,53 +587,91 @@ class EzyVetApi:
             A dictionary containing the requested data.
         """
         url = f'{api_url}{endpoint}'
-        data = self._call_api(url, headers, params, db, location_id)
+        # Each item comes back wrapped as {endpoint_name: {record}}; the unwrap key is bound once and
+        # applied as each page arrives.
+        unwrap = itemgetter(endpoint.rsplit('/', 1)[1])
+        # The query string is identical for every page except the page number, so it is encoded once here
+        # with the page number appended as a literal suffix.
+        base_qs = urlencode(params)
+        data = self._call_api(f'{url}?{base_qs}', headers, None, db, location_id)
 
         if 'items_total' in data['meta']:
             record_count = data['meta']['items_total']
         else:
-            print(f'items_total not found \n {data}')
+            logger.warning('items_total not found: %s', data)
             return False
         pages = int(data['meta']['items_page_total'])
-        print(f'Returned {record_count} records over {pages} pages.')
-        output = []
-        if len(data['items']):
-            output += data['items']
-        else:
-            print('No results returned')
+        logger.info('Returned %s records over %s pages.', record_count, pages)
+        if not len(data['items']):
+            logger.info('No results returned')
             return False
-
-        if pages > 1:
-            # Get the next page of data. EzyVet will only return 10 records per page so a pagination call needs to be
-            # made.
-            minute_call_counter = 1
-            self.start_time = datetime.now() if not self.start_time else self.start_time
-            for page_num in range(2, pages + 1):
-                # Rate limits call for no more than 60 calls per minute to any one endpoint (you could
-                # call two endpoints at the same time up to 120 total calls a min). This throttles the
-                # call speed to stay under the limit.
-
-                if minute_call_counter >= calls_per_minute_limit:
-                    elapsed_seconds = (datetime.now() - self.start_time).seconds
-                    time_remaining = elapsed_seconds - seconds_in_a_min
-                    if time_remaining > 0:
-                        print(
-                            f"Rate limit reached. It's been {elapsed_seconds} seconds. Sleeping for {time_remaining}s.")
-                        # Add 1 just to give a small amount of wiggle room.
-                        time.sleep(time_remaining + 1)
-                    minute_call_counter = 0
-                    self.start_time = datetime.now()
-                # Add a "page" variable to the params
-                params['page'] = page_num
-                data = self._call_api(url, headers, params, db, location_id)
+        page_records = list(map(unwrap, data['items']))
+        if pages <= 1:
+            # Single-page pulls are the common small-query case; return before building any paging state.
+            return page_records
+
+        # The advertised total sizes the output list up front; any shortfall is trimmed after the last page.
+        output = [None] * record_count
+        output[:len(page_records)] = page_records
+        pos = len(page_records)
+
+        # Get the next pages of data. EzyVet will only return a limited number of records per page so pagination
+        # calls need to be made. Pages are independent of each other, so each wave of pages is fetched
+        # concurrently through a thread pool sharing the pooled session.
+        minute_call_counter = 1
+        self.start_time = datetime.now() if not self.start_time else self.start_time
+        remaining_pages = list(range(2, pages + 1))
+        executor = self._get_executor()
+        while remaining_pages:
+            # Rate limits call for no more than 60 calls per minute to any one endpoint (you could
+            # call two endpoints at the same time up to 120 total calls a min). This throttles the
+            # call speed to stay under the limit by sizing each wave to the remaining allowance.
+            minute_call_counter = self._throttle(minute_call_counter, calls_per_minute_limit,
+                                                 seconds_in_a_min)
+            wave = remaining_pages[:calls_per_minute_limit - minute_call_counter]
+            del remaining_pages[:len(wave)]
+            # Each page gets its own URL, so concurrent calls share no mutable state.
+            results = executor.map(
+                lambda page_num: self._call_api(f'{url}?{base_qs}&page={page_num}', headers, None, db,
+                                                location_id),
+                wave)
+            for page_num, data in zip(wave, results):
                 page_item_count = data['meta']['items_page_size']
-                print(f'Page {page_num} has {page_item_count} records.')
-                output += data['items']
-                minute_call_counter += 1
-        output = [x[endpoint.split('/')[1]] for x in output]
+                logger.debug('Page %s has %s records.', page_num, page_item_count)
+                page_records = list(map(unwrap, data['items']))
+                output[pos:pos + len(page_records)] = page_records
+                pos += len(page_records)
+            minute_call_counter += len(wave)
+        del output[pos:]
 
         return output
 
+    def _throttle(self, minute_call_counter: int, calls_per_minute_limit: int, seconds_in_a_min: int) -> int:
+        """
+        Sleeps out the remainder of the minute when the per-minute call allowance is spent.
+
+        Args:
+            minute_call_counter: Calls made since start_time.
+            calls_per_minute_limit: The number of calls that can be made to the API in one minute.
+            seconds_in_a_min: The number of seconds in a minute. This gets overridden during unit tests so
+                              that the test doesn't take too long.
+
+        Returns:
+            The updated call counter: zero after a reset, otherwise unchanged.
+        """
+        if minute_call_counter >= calls_per_minute_limit:
+            elapsed_seconds = (datetime.now() - self.start_time).seconds
+            # Once a full minute has already elapsed the next wave can fire immediately.
+            time_remaining = seconds_in_a_min - elapsed_seconds
+            if time_remaining > 0:
+                logger.info("Rate limit reached. It's been %s seconds. Sleeping for %ss.",
+                            elapsed_seconds, time_remaining)
+                # Add 1 just to give a small amount of wiggle room.
+                time.sleep(time_remaining + 1)
+            minute_call_counter = 0
+            self.start_time = datetime.now()
+        return minute_call_counter
+
     def _call_api(self,
                   url: str,
                   headers: dict,
@@ -385,12 +693,19 @@ class EzyVetApi:
         Returns:
             A dict containing the query results.
         """
-        res = requests.get(url, headers=headers, params=params)
+        try:
+            res = self._session.get(url, headers=headers, params=params, timeout=self._api_timeout)
+        except requests.exceptions.RetryError as e:
+            # The session adapter already retried with backoff; exhausting those retries is a hard failure
+            # and surfaces through the module's own error type.
+            logger.error('Retries exhausted for %s', url)
+            raise EzyVetAPIError(f'API retries exhausted for URL: {url}') from e
         if res.status_code != 200:
             # Code 401 is unauthorized client.
             if res.status_code == 401 and fail_counter <= self._config.api_fail_count:
                 # Something is wrong with the token. Get a new one.
-                print(f'Token expired or otherwise was invalid. Pulling new token. This is attempt {fail_counter}')
+                logger.warning('Token expired or otherwise was invalid. Pulling new token. This is attempt %s',
+                               fail_counter)
                 api_credentials = self._get_api_credentials(location_id,
                                                             self._config.ezy_vet_api,
                                                             db,
@@ -400,20 +715,15 @@ class EzyVetApi:
                 # Recursive call.
                 fail_counter += 1
                 return self._call_api(url, headers, params, db, location_id, fail_counter)
-            elif fail_counter <= self._config.api_fail_count:
-                sleep_time = self._config.server_retry_sleep_time
-                print(f'API returned {res.status_code} status code. Retrying in {sleep_time} seconds. \n'
-                      f'This is attempt {fail_counter}. Message: \n{res.text}')
-                time.sleep(sleep_time)
-                fail_counter += 1
-                # Recursive call.
-                return self._call_api(url, headers, params, db, location_id, fail_counter)
             else:
-                print(res.text)
+                # Retryable status codes were already retried with backoff by the session adapter, so
+                # anything still non-200 here is treated as a hard failure.
+                logger.error(res.text)
                 raise EzyVetAPIError(f'API returned a non-200 status code. res: {res.status_code} \n'
                                      f'res.text: {res.text}')
 
-        data = res.json()
+        # orjson decodes the raw bytes directly.
+        data = self._decode_json(res.content)
         return data
 
     @staticmethod
@@ -445,41 +755,31 @@ class EzyVetApi:
         Returns:
             A dictionary containing the appropriate date range.
         """
-        # Check to make sure that at least a get_appointments or end date exists.
-        output = {filter_field: None}
         if end_date:
             # For end date to be inclusive, it must have a time at the end of the day.
             # If end_date has no time information, assume full day and correct here.
-            time_test = end_date.hour + end_date.minute + end_date.second
-            if time_test == 0:
-                end_date = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59)
+            if end_date.hour + end_date.minute + end_date.second == 0:
+                end_date = end_date.replace(hour=23, minute=59, second=59)
 
-        if start_date and not end_date:
-            start_timestamp = time.mktime(start_date.timetuple())
+        # Resolve the missing side of the range before building the filter.
+        if start_date and end_date:
+            if days:
+                raise StartEndAndDaysSet('You cannot set the get_appointments date, end date, and days.')
+        elif start_date:
             if days:
                 end_date = start_date + timedelta(days=days)
-                end_timestamp = time.mktime(end_date.timetuple())
-                return {filter_field: {'gt': start_timestamp, 'lte': end_timestamp}}
-            else:
-                return {filter_field: {'gt': start_timestamp}}
-        elif end_date and not start_date:
-            end_timestamp = time.mktime(end_date.timetuple())
+        elif end_date:
             if days:
                 start_date = end_date - timedelta(days=days)
-                start_timestamp = time.mktime(start_date.timetuple())
-                return {filter_field: {'gt': start_timestamp, 'lte': end_timestamp}}
             else:
-                return {filter_field: {'lt': end_timestamp}}
-        elif start_date and end_date:
-            if days:
-                raise StartEndAndDaysSet('You cannot set the get_appointments date, end date, and days.')
-            else:
-                start_timestamp = time.mktime(start_date.timetuple())
-                end_timestamp = time.mktime(end_date.timetuple())
-                return {filter_field: {'gt': start_timestamp, 'lte': end_timestamp}}
+                return {filter_field: {'lt': end_date.timestamp()}}
         else:
             raise MissingStartAndEndDate("You must set either a get_appointments or end date for build_date_filter.")
 
+        if end_date:
+            return {filter_field: {'gt': start_date.timestamp(), 'lte': end_date.timestamp()}}
+        return {filter_field: {'gt': start_date.timestamp()}}
+
 
 class MissingStartAndEndDate(Exception):
     pass
@@ -1,6 +1,7 @@
 from ezyvetapi.main import EzyVetApi
 
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List
 
@@ -50,15 +51,25 @@ class Appointments(Model):
         if not start_date or not end_date:
             start_date, end_date = self.get_most_recent('appointments', 'modified_at', 'is_shelter_animal_booking', False)
         params = {'active': True}
-        appointments_df = ezy.get_date_range(self.location_id, 'v2', 'appointment', 'modified_at', params=params,
-                                             start_date=start_date, end_date=end_date, dataframe_flag=True)
+        # The two translation tables and the resource list are independent of the main pull, so they
+        # download in the background while the (much larger) appointment body comes down.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            type_future = pool.submit(ezy.get_translation, self.location_id, 'v1', 'appointmenttype')
+            status_future = pool.submit(ezy.get_translation, self.location_id, 'v1', 'appointmentstatus')
+            resource_future = pool.submit(ezy.get, self.location_id, 'v1', 'resource', dataframe_flag=True)
+            appointments_df = ezy.get_date_range(self.location_id, 'v2', 'appointment', 'modified_at', params=params,
+                                                 start_date=start_date, end_date=end_date, dataframe_flag=True)
 
         if isinstance(appointments_df, pd.DataFrame):
-            self._remove_block_out_bookings(self.location_id, appointments_df, self._filtered_types)
+            appointments_df = self._remove_block_out_bookings(self.location_id, appointments_df,
+                                                              self._filtered_types)
             appointments_df.rename(columns={'id': 'ezyvet_id'}, inplace=True)
-            self._translate_id_fields(self.location_id, appointments_df, ezy)
+            self._translate_id_fields(self.location_id, appointments_df, ezy,
+                                      type_translation=type_future.result(),
+                                      status_translation=status_future.result())
             self._set_primary_resource_id(appointments_df)
-            self._add_resource_data(self.location_id, appointments_df, ezy)
+            self._add_resource_data(self.location_id, appointments_df, ezy,
+                                    resource_df=resource_future.result())
 
             self._assign_division_location_id(appointments_df, self.location_id)
             appointments_df = self._set_data_types(appointments_df)
@@ -105,7 +116,9 @@ class Appointments(Model):
         Returns:
             None
         """
-        appointments_df['description'] = appointments_df['description'].str[:1999]
+        # Non-string cells (NaN) pass through untouched.
+        truncate = np.frompyfunc(lambda s: s[:1999] if isinstance(s, str) else s, 1, 1)
+        appointments_df['description'] = truncate(appointments_df['description'].to_numpy())
 
     @staticmethod
     def _remove_columns(appointments_df: pd.DataFrame) -> pd.DataFrame:
@@ -123,8 +136,12 @@ class Appointments(Model):
                            'animal_id', 'consult_id', 'contact_id', 'sales_resource', 'resource_id', 'ownership_id',
                            'primary_resource_name', 'sales_resource_name', 'datetime_created', 'datetime_modified',
                            'datetime_start_at', 'is_medical', 'appt_type_id', 'first_appt']
-        appointments_df = appointments_df[columns_to_keep].copy()
-        return appointments_df
+        # Dropping the unwanted columns in place just releases their references; selecting with .copy()
+        # would duplicate every kept column. The final selection only reorders.
+        keep = set(columns_to_keep)
+        drop_cols = [col for col in appointments_df.columns if col not in keep]
+        appointments_df.drop(columns=drop_cols, inplace=True)
+        return appointments_df[columns_to_keep]
 
     @staticmethod
     def _set_data_types(appointments_df: pd.DataFrame) -> pd.DataFrame:
@@ -137,13 +154,22 @@ class Appointments(Model):
         Returns:
             Appointments dataframe with correct dtypes assigned.
         """
-        appointments_df = appointments_df.astype(
-            dtype={'animal_id': 'Int64', 'consult_id': 'Int64', 'contact_id': 'Int64'})
-        appointments_df['active'] = appointments_df['active'].astype(int)
+        # EzyVet ids fit comfortably in 32 bits and the flag columns in 8, which shrinks the frame and
+        # speeds downstream filters. Translated name columns have a few dozen distinct values, so category
+        # dtype stores each value once.
+        int_casts = {'animal_id': 'Int32', 'consult_id': 'Int32', 'contact_id': 'Int32',
+                     'resource_id': 'Int32', 'appt_type_id': 'Int16'}
+        int_casts = {col: dtype for col, dtype in int_casts.items() if col in appointments_df.columns}
+        appointments_df = appointments_df.astype(dtype=int_casts)
+        appointments_df['active'] = appointments_df['active'].astype('int8')
+        for col in ('type_id', 'status_id', 'primary_resource_name', 'sales_resource_name'):
+            if col in appointments_df.columns:
+                appointments_df[col] = appointments_df[col].astype('category')
         return appointments_df
 
     @staticmethod
-    def _remove_block_out_bookings(location_id: int, appointments_df: pd.DataFrame, filtered_types: dict) -> None:
+    def _remove_block_out_bookings(location_id: int, appointments_df: pd.DataFrame,
+                                   filtered_types: dict) -> pd.DataFrame:
         """
         Removes block out type bookings.
 
@@ -153,15 +179,16 @@ class Appointments(Model):
             filtered_types: A dict containing appointment type ID's to remove.
 
         Returns:
-            None
+            The appointments dataframe with block out bookings removed.
         """
         # If you get an error here, you should scroll up and check filtered_types under def get_appointments
-        mask = appointments_df['type_id'].isin(filtered_types[location_id])
-        appointments_df.drop(appointments_df[mask].index, inplace=True)
-        appointments_df.reset_index(drop=True, inplace=True)
+        remove_ids = np.fromiter(filtered_types[location_id], dtype=np.int64)
+        keep_mask = ~np.isin(appointments_df['type_id'].to_numpy(), remove_ids)
+        return appointments_df[keep_mask].reset_index(drop=True)
 
     @staticmethod
-    def _add_resource_data(location_id: int, appointments_df: pd.DataFrame, ezy: EzyVetApi) -> None:
+    def _add_resource_data(location_id: int, appointments_df: pd.DataFrame, ezy: EzyVetApi,
+                           resource_df: pd.DataFrame = None) -> None:
         """
         Converts resource ID values to names.
 
@@ -169,20 +196,19 @@ class Appointments(Model):
             location_id: The location ID to process
             appointments_df: Dataframe containing appointments
             ezy: An instance of the EzyVet API Main class.
+            resource_df: Optional pre-fetched resource dataframe. Fetched from the API when omitted.
 
         Returns:
             None, Pass by ref.
         """
-        resource_df = ezy.get(location_id, 'v1', 'resource', dataframe_flag=True)
-        # resource_df = resource_df[['id', 'ownership_id', 'name']].copy()
-        # resources = resource_df.to_list()
-        resource_df.index = resource_df['id'].astype(int)
-        appointments_df['ownership_id'] = appointments_df['resource_id'].apply(
-            lambda x: resource_df.loc[x, 'ownership_id'])
-        appointments_df['primary_resource_name'] = appointments_df['resource_id'].apply(
-            lambda x: resource_df.loc[x, 'name'])
-        appointments_df['sales_resource_name'] = appointments_df['sales_resource'].apply(
-            lambda x: resource_df.loc[x, 'name'])
+        if resource_df is None:
+            resource_df = ezy.get(location_id, 'v1', 'resource', dataframe_flag=True)
+        resource_ids = resource_df['id'].astype(int)
+        ownership_map = dict(zip(resource_ids, resource_df['ownership_id']))
+        name_map = dict(zip(resource_ids, resource_df['name']))
+        appointments_df['ownership_id'] = appointments_df['resource_id'].map(ownership_map)
+        appointments_df['primary_resource_name'] = appointments_df['resource_id'].map(name_map)
+        appointments_df['sales_resource_name'] = appointments_df['sales_resource'].map(name_map)
 
     @staticmethod
     def _set_primary_resource_id(appointments_df: pd.DataFrame) -> None:
@@ -202,11 +228,13 @@ class Appointments(Model):
         Returns:
             None. Pass by ref.
         """
-        mask = ~pd.isna(appointments_df['resources'])
-        appointments_df.loc[mask, 'resource_id'] = appointments_df.loc[mask, 'resources'].apply(lambda x: x[0]['id'])
+        # Rows with no resource list get NaN.
+        resources = appointments_df['resources'].to_numpy()
+        appointments_df['resource_id'] = [x[0]['id'] if isinstance(x, list) and x else np.nan for x in resources]
 
     @staticmethod
-    def _translate_id_fields(location_id: int, appointments_df: pd.DataFrame, ezy: EzyVetApi) -> None:
+    def _translate_id_fields(location_id: int, appointments_df: pd.DataFrame, ezy: EzyVetApi,
+                             type_translation: dict = None, status_translation: dict = None) -> None:
         """
         Translates the Appointment Type and Appointment Status fields from a number to a text value.
 
@@ -214,14 +242,23 @@ class Appointments(Model):
             location_id: The location ID to process
             appointments_df: Dataframe containing appointments
             ezy: An instance of the EzyVet API Main class.
+            type_translation: Optional pre-fetched appointment type translation dict.
+            status_translation: Optional pre-fetched appointment status translation dict.
 
         Returns:
             None, Pass by ref.
         """
         appointments_df['first_appt'] = np.nan
         appointments_df['appt_type_id'] = appointments_df['type_id']
-        appointments_df['type_id'].replace(ezy.get_translation(location_id, 'v1', 'appointmenttype'), inplace=True)
-        appointments_df['status_id'].replace(ezy.get_translation(location_id, 'v1', 'appointmentstatus'), inplace=True)
+        # fillna keeps any id that has no translation rather than leaving a NaN.
+        if type_translation is None:
+            type_translation = ezy.get_translation(location_id, 'v1', 'appointmenttype')
+        appointments_df['type_id'] = appointments_df['type_id'].map(type_translation) \
+            .fillna(appointments_df['type_id'])
+        if status_translation is None:
+            status_translation = ezy.get_translation(location_id, 'v1', 'appointmentstatus')
+        appointments_df['status_id'] = appointments_df['status_id'].map(status_translation) \
+            .fillna(appointments_df['status_id'])
 
     @staticmethod
     def _create_is_medical_column(location_id: int, appointments_df: pd.DataFrame, is_medical: dict) -> pd.DataFrame:
@@ -245,10 +282,10 @@ class Appointments(Model):
         Returns:
             The appointments dataframe.
         """
-        appointments_df['is_medical'] = 0
-        mask = (appointments_df['appt_type_id'].isin(is_medical[location_id])) & (
-                appointments_df['is_medical'] == 0)
-        appointments_df.loc[mask, 'is_medical'] = 1
+        # int8 keeps the flag column small.
+        medical_ids = np.fromiter(is_medical[location_id], dtype=np.int64, count=len(is_medical[location_id]))
+        appointments_df['is_medical'] = np.isin(appointments_df['appt_type_id'].to_numpy(),
+                                                medical_ids).astype(np.int8)
 
         return appointments_df
 
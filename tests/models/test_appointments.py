@@ -82,16 +82,16 @@ class TestAppointments(TestCase):
         df = pd.DataFrame(data)
         res = a._set_data_types(df)
         dt = res.dtypes
-        self.assertEqual(dt['animal_id'], 'Int64')
-        self.assertEqual(dt['consult_id'], 'Int64')
-        self.assertEqual(dt['contact_id'], 'Int64')
-        self.assertEqual(dt['active'], int)
+        self.assertEqual(dt['animal_id'], 'Int32')
+        self.assertEqual(dt['consult_id'], 'Int32')
+        self.assertEqual(dt['contact_id'], 'Int32')
+        self.assertEqual(dt['active'], 'int8')
 
     def test__remove_block_out_bookings(self):
         a = Appointments(2, MockDBManager())
         df = pd.DataFrame({'type_id': [1, 2, 3, 4, 5, 6]})
 
-        a._remove_block_out_bookings(2, df, {2: [2, 4]})
+        df = a._remove_block_out_bookings(2, df, {2: [2, 4]})
         test = len(df['type_id'])
         golden = 4
         self.assertEqual(golden, test)
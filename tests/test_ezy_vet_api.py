@@ -88,6 +88,42 @@ class TestEzyVetApi(TestCase):
         golden = 1
         self.assertEqual(golden, test)
 
+        # Check more than 100 IDs, which splits into two concurrently fetched batches.
+        ids = list(range(1, 151))
+        e.golden = [{'id': {'in': ids[:100]}}, {'id': {'in': ids[100:]}}]
+        # All-int frames share one dtype, exercising the numpy stacking path in _concat_batches.
+        e.get_api_mock_return_value = lambda batch_params: pd.DataFrame(
+            {'id': batch_params['id']['in'], 'active': [1] * len(batch_params['id']['in'])})
+        res = e.get_by_ids(2, 'v2', 'testing', ids, dataframe_flag=True)
+        self.assertTrue(isinstance(res, pd.DataFrame))
+        test = len(res)
+        golden = 150
+        self.assertEqual(golden, test)
+        # Rows stay in submission order across the batch boundary.
+        test = res.loc[0, 'id']
+        golden = 1
+        self.assertEqual(golden, test)
+        test = res.loc[100, 'id']
+        golden = 101
+        self.assertEqual(golden, test)
+        test = res.loc[149, 'id']
+        golden = 150
+        self.assertEqual(golden, test)
+
+        # Mixed-dtype frames take the pd.concat fallback in _concat_batches.
+        e.get_api_mock_return_value = lambda batch_params: pd.DataFrame(
+            {'id': batch_params['id']['in'], 'testme': ['string value'] * len(batch_params['id']['in'])})
+        res = e.get_by_ids(2, 'v2', 'testing', ids, dataframe_flag=True)
+        test = len(res)
+        golden = 150
+        self.assertEqual(golden, test)
+        test = res.loc[100, 'id']
+        golden = 101
+        self.assertEqual(golden, test)
+        test = res.loc[149, 'testme']
+        golden = 'string value'
+        self.assertEqual(golden, test)
+
     def test__build_params(self):
         e = EzyVetApi(test_mode=True)
         res = e._build_params()
@@ -115,6 +151,32 @@ class TestEzyVetApi(TestCase):
         golden = 'updated_cache_token'
         self.assertEqual(golden, test)
 
+    def test__get_api_credentials_many(self):
+        e = MockEzyVetAPI_test__get_api_credentials_many()
+        db = MockDBManager_test__get_api_credentials_many()
+        e._db = db
+        # Test with no timeout.
+        res = e._get_api_credentials_many([3, 4])
+        test = res[3]['access_token']
+        golden = 'abc123'
+        self.assertEqual(golden, test)
+
+        test = res[4]['access_token']
+        golden = 'abc123'
+        self.assertEqual(golden, test)
+
+        # Both locations should now be in the credential cache.
+        test = sorted(e._api_credentials_cache.keys())
+        golden = [3, 4]
+        self.assertEqual(golden, test)
+
+        # Test expired cache
+        db.system_time = datetime(2021, 1, 1, 5, 44, 22)
+        res = e._get_api_credentials_many([3, 4])
+        test = res[3]['access_token']
+        golden = 'updated_cache_token'
+        self.assertEqual(golden, test)
+
     def test__get_translation(self):
         e = MockEzyVetAPI_test_get()
         data = [
@@ -140,6 +202,21 @@ class TestEzyVetApi(TestCase):
         golden = 6
         self.assertEqual(golden, test)
 
+        # A second call inside the TTL serves from the cache without hitting the API again.
+        call_count = e.get_api_call_count
+        res = e.get_translation(1, 'v2', 'testme')
+        test = res[1]
+        golden = 'red'
+        self.assertEqual(golden, test)
+        self.assertEqual(call_count, e.get_api_call_count)
+
+        # refresh=True bypasses the cache and re-fetches the table.
+        res = e.get_translation(1, 'v2', 'testme', refresh=True)
+        test = res[1]
+        golden = 'red'
+        self.assertEqual(golden, test)
+        self.assertEqual(call_count + 1, e.get_api_call_count)
+
     def test__set_headers(self):
         e = EzyVetApi(test_mode=True)
         api_credentials = {'access_token': 'abc123'}
@@ -289,13 +366,12 @@ class TestEzyVetApi(TestCase):
                                         days=days)
 
 
-class MockEzyVetAPI_test__get_api_credentials(TestCase):
+class MockEzyVetAPI_test__get_api_credentials:
 
     def __init__(self):
         # This is set so the time can be modified to test the access_token expire timeout.
         self.system_time = datetime(2021, 1, 1, 5, 34, 22)
         self.db_schema = 'test'
-        super().__init__()
 
     def get_sql_list_dicts(self, sql, parmas):
         return [{
@@ -307,14 +383,50 @@ class MockEzyVetAPI_test__get_api_credentials(TestCase):
 
     def execute_simple(self, sql, params=None):
         golden = 'update test.ezy_vet_credentials set access_token=%s, access_token_create_time=%s where location_id = %s'
-        self.assertEqual(golden, sql)
+        assert golden == sql, sql
 
         test = params[0]
         golden = 'updated_cache_token'
-        self.assertEqual(golden, test)
+        assert golden == test, test
+
 
+class MockDBManager_test__get_api_credentials_many:
 
-class MockEzyVetAPI_test_get(EzyVetApi, TestCase):
+    def __init__(self):
+        # This is set so the time can be modified to test the access_token expire timeout.
+        self.system_time = datetime(2021, 1, 1, 5, 34, 22)
+        self.db_schema = 'test'
+
+    def get_sql_list_dicts(self, sql, params):
+        golden = 'select *, getdate() as system_time from test.ezy_vet_credentials where location_id in %s'
+        assert golden == sql, sql
+        assert isinstance(params[0], tuple), params
+        return [{
+            'location_id': location_id,
+            'system_time': self.system_time,
+            'access_token': 'abc123',
+            'access_token_create_time': datetime(2021, 1, 1, 5, 32, 22),
+        } for location_id in params[0]]
+
+    def execute_simple(self, sql, params=None):
+        golden = 'update test.ezy_vet_credentials set access_token=%s, access_token_create_time=%s where location_id = %s'
+        assert golden == sql, sql
+
+        test = params[0]
+        golden = 'updated_cache_token'
+        assert golden == test, test
+
+
+class MockEzyVetAPI_test__get_api_credentials_many(EzyVetApi):
+
+    def __init__(self):
+        super().__init__(test_mode=True)
+
+    def get_access_token(self, api_url, api_credentials, scopes=None):
+        return 'updated_cache_token'
+
+
+class MockEzyVetAPI_test_get(EzyVetApi):
     """
     A mockup class of the EzyVet API to allow for certain method overrides.
 
@@ -322,6 +434,7 @@ class MockEzyVetAPI_test_get(EzyVetApi, TestCase):
 
     def __init__(self):
         self.get_api_mock_return_value = None
+        self.get_api_call_count = 0
         super().__init__(test_mode=True)
         self.test_rate_limit = False
         self.start_time = datetime.now()
@@ -339,11 +452,12 @@ class MockEzyVetAPI_test_get(EzyVetApi, TestCase):
                            calls_per_minute_limit: int = 60,
                            seconds_in_a_min: int = 60) -> list:
 
+        self.get_api_call_count += 1
         if self.test_rate_limit:
             elapsed_time = (datetime.now() - self.start_time).seconds
             print(f'There have been {self.rate_counter} calls in {elapsed_time} seconds')
             if self.rate_counter > self.test_rate_limit and elapsed_time >= self.rate_time_window:
-                self.fail()
+                raise AssertionError('Rate limit exceeded')
 
         return self.get_api_mock_return_value
 
@@ -383,7 +497,7 @@ class MockEzyVetAPI_test_get_data_from_api(EzyVetApi):
         return self.get_api_mock_return_value
 
 
-class MockEzyVetAPI_test_get_by_id(EzyVetApi, TestCase):
+class MockEzyVetAPI_test_get_by_id(EzyVetApi):
 
     def __init__(self):
         self.get_api_mock_return_value = None
@@ -398,6 +512,12 @@ class MockEzyVetAPI_test_get_by_id(EzyVetApi, TestCase):
             headers: dict = None,
             dataframe_flag: bool = False
             ):
-        self.assertDictEqual(self.golden, params)
-
+        # Multi-batch tests supply one golden params dict per expected batch.
+        if isinstance(self.golden, list):
+            assert params in self.golden, params
+        else:
+            assert self.golden == params, params
+
+        if callable(self.get_api_mock_return_value):
+            return self.get_api_mock_return_value(params)
         return self.get_api_mock_return_value